@@ -2,7 +2,9 @@ import os
 import sys
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth1
+from urllib3.util.retry import Retry
 
 # Load environment variables from .env
 load_dotenv()
@@ -28,10 +30,19 @@ auth = OAuth1(
     ACCESS_TOKEN_SECRET,
 )
 
+# Reuse one keep-alive connection for the lookup and the add
+SESSION = requests.Session()
+SESSION.auth = auth
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504], raise_on_status=False),
+))
+
 def get_user_id(username: str) -> str:
     """Look up the user ID for a given Twitter handle."""
     url = f"{BASE_URL}/users/by/username/{username}"
-    response = requests.get(url, auth=auth)
+    response = SESSION.get(url)
 
     if response.status_code != 200:
         raise Exception(f"Error fetching user: {response.status_code} - {response.text}")
@@ -46,7 +57,7 @@ def add_to_list(user_id: str):
     url = f"{BASE_URL}/lists/{LIST_ID}/members"
     payload = {"user_id": user_id}
 
-    response = requests.post(url, auth=auth, json=payload)
+    response = SESSION.post(url, json=payload)
 
     if response.status_code == 200:
         print(f"✅ Added user {user_id} to list {LIST_ID}")
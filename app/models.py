@@ -1,20 +1,39 @@
 from datetime import datetime
+import re
 from app import db
 
+# Twitter handles are 1-15 letters, digits or underscores
+_HANDLE_RE = re.compile(r'\A[A-Za-z0-9_]{1,15}\Z')
+
 
 class Submission(db.Model):
     """Model for Twitter list submission requests"""
     __tablename__ = 'submissions'
+    __table_args__ = (
+        # Serves the pending queue: WHERE status = ... ORDER BY submitted_at, id
+        # (also covers plain status filters, so status needs no index of its own)
+        db.Index('ix_submissions_status_submitted_at', 'status', 'submitted_at', 'id'),
+        # Trigram indexes for admin search substring matches (requires the pg_trgm extension)
+        db.Index(
+            'ix_submissions_email_trgm', 'email',
+            postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}
+        ),
+        db.Index(
+            'ix_submissions_twitter_handle_trgm', 'twitter_handle',
+            postgresql_using='gin', postgresql_ops={'twitter_handle': 'gin_trgm_ops'}
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(255), nullable=False, index=True)
     twitter_handle = db.Column(db.String(50), nullable=False, unique=True, index=True)
-    status = db.Column(db.String(20), nullable=False, default='pending', index=True)
-    twitter_user_id = db.Column(db.String(50), nullable=True)
+    status = db.Column(db.String(20), nullable=False, default='pending')
+    twitter_user_id = db.Column(db.BigInteger, nullable=True)
     submitted_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     processed_at = db.Column(db.DateTime, nullable=True)
     processed_by = db.Column(db.String(100), nullable=True)
-    notes = db.Column(db.Text, nullable=True)
+    # Deferred: free-form text that list views never render, loaded on first access
+    notes = db.deferred(db.Column(db.Text, nullable=True))
     created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -34,6 +53,11 @@ class Submission(db.Model):
         """Remove @ symbol and convert to lowercase"""
         return handle.lstrip('@').lower().strip()
 
+    @staticmethod
+    def is_valid_handle(handle):
+        """Check a handle (without @) against Twitter's username format"""
+        return bool(_HANDLE_RE.match(handle))
+
     def approve(self, twitter_user_id):
         """Mark submission as approved"""
         self.status = self.STATUS_APPROVED
@@ -54,7 +78,8 @@ class Submission(db.Model):
             'email': self.email,
             'twitter_handle': self.twitter_handle,
             'status': self.status,
-            'twitter_user_id': self.twitter_user_id,
+            # Serialized as a string: 64-bit IDs lose precision as JSON numbers in JS
+            'twitter_user_id': str(self.twitter_user_id) if self.twitter_user_id else None,
             'submitted_at': self.submitted_at.isoformat() if self.submitted_at else None,
             'processed_at': self.processed_at.isoformat() if self.processed_at else None,
             'processed_by': self.processed_by,
@@ -68,9 +93,13 @@ class Submission(db.Model):
 class ListMember(db.Model):
     """Model for Twitter list members (source of truth for who's on the list)"""
     __tablename__ = 'list_members'
+    __table_args__ = (
+        # Serves the dashboard members table: ORDER BY synced_at DESC, id DESC
+        db.Index('ix_list_members_synced_at_id', 'synced_at', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    twitter_user_id = db.Column(db.String(50), nullable=False, unique=True, index=True)
+    twitter_user_id = db.Column(db.BigInteger, nullable=False, unique=True, index=True)
     username = db.Column(db.String(50), nullable=False, index=True)
     name = db.Column(db.String(255), nullable=True)
 
@@ -98,7 +127,7 @@ class ListMember(db.Model):
         """Convert member to dictionary"""
         return {
             'id': self.id,
-            'twitter_user_id': self.twitter_user_id,
+            'twitter_user_id': str(self.twitter_user_id) if self.twitter_user_id else None,
             'username': self.username,
             'name': self.name,
             'source': self.source,
@@ -116,7 +145,7 @@ class SyncLog(db.Model):
     __tablename__ = 'sync_logs'
 
     id = db.Column(db.Integer, primary_key=True)
-    sync_started_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    sync_started_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
     sync_completed_at = db.Column(db.DateTime, nullable=True)
 
     members_fetched = db.Column(db.Integer, default=0)
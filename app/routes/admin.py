@@ -1,14 +1,101 @@
-from flask import Blueprint, render_template, request, jsonify, flash, redirect, url_for, current_app, session
+from flask import Blueprint, render_template, request, jsonify, flash, redirect, url_for, session, g
 from sqlalchemy import func
-from datetime import datetime, timezone
+from datetime import datetime
+import calendar
 import re
+import time
+from typing import TYPE_CHECKING
 from app import db
 from app.models import Submission, ListMember, SyncLog
-from app.services.twitter_service import TwitterService
-from app.services.sync_service import SyncService
+
+# Twitter/sync services (and the requests/OAuth stack behind them) are imported
+# inside the handlers that call Twitter, so read-only pages don't load them
+if TYPE_CHECKING:
+    from app.services.twitter_service import TwitterService
 
 bp = Blueprint('admin', __name__)
 
+# Cached dashboard sync state (see get_sync_state)
+SYNC_STATE_TTL_SECONDS = 5
+_sync_state_cache = {'value': None, 'expires': 0.0}
+
+# Page size, read from the app config once when the blueprint is registered
+_PER_PAGE = 20
+
+# Rate limit error parsing (see parse_rate_limit_reset)
+_RATE_LIMIT_MARKER = 'rate limit exceeded'
+_RESET_AT_RE = re.compile(r'Resets at (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+_TS_RE = re.compile(r'timestamp[:\s]+(\d+)')
+
+
+@bp.record_once
+def _load_config(setup_state):
+    """Cache config values used by every request handler"""
+    global _PER_PAGE
+    _PER_PAGE = setup_state.app.config.get('ITEMS_PER_PAGE', 20)
+
+
+class ProbePagination:
+    """Page of query results that knows whether a next page exists without counting rows"""
+
+    def __init__(self, items, page, per_page, has_next):
+        self.items = items
+        self.page = page
+        self.per_page = per_page
+        self.has_next = has_next
+
+    @property
+    def has_prev(self) -> bool:
+        return self.page > 1
+
+    @property
+    def prev_num(self):
+        return self.page - 1 if self.has_prev else None
+
+    @property
+    def next_num(self):
+        return self.page + 1 if self.has_next else None
+
+
+def paginate_without_count(query, page: int, per_page: int) -> ProbePagination:
+    """
+    Paginate a query by fetching one extra row instead of issuing SELECT COUNT(*).
+
+    Args:
+        query: Ordered query to paginate
+        page: 1-based page number
+        per_page: Number of items per page
+
+    Returns:
+        ProbePagination: Items for the page plus prev/next navigation info
+    """
+    page = max(page, 1)
+    rows = query.limit(per_page + 1).offset((page - 1) * per_page).all()
+    return ProbePagination(rows[:per_page], page, per_page, has_next=len(rows) > per_page)
+
+
+def get_submission_or_404(submission_id: int) -> Submission:
+    """
+    Load a submission with just the columns the approve/reject/remove handlers read.
+
+    The status check that follows often rejects the request, so there is no
+    point hydrating every column (the handlers only assign the others).
+
+    Args:
+        submission_id: Submission primary key
+
+    Returns:
+        Submission: Partially loaded submission (aborts with 404 if missing)
+    """
+    return Submission.query.options(
+        db.load_only(
+            Submission.id,
+            Submission.status,
+            Submission.twitter_handle,
+            Submission.twitter_user_id
+        )
+    ).filter_by(id=submission_id).first_or_404()
+
 
 def parse_rate_limit_reset(error_message: str) -> int:
     """
@@ -21,18 +108,16 @@ def parse_rate_limit_reset(error_message: str) -> int:
         int: Unix timestamp when rate limit resets, or 0 if not found
     """
     # Look for pattern like "Resets at 2025-11-12 16:27:12"
-    match = re.search(r'Resets at (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', error_message)
+    match = _RESET_AT_RE.search(error_message)
     if match:
         try:
             # Parse and treat as UTC since Twitter API returns UTC timestamps
-            dt = datetime.strptime(match.group(1), '%Y-%m-%d %H:%M:%S')
-            dt = dt.replace(tzinfo=timezone.utc)
-            return int(dt.timestamp())
+            return calendar.timegm(time.strptime(match.group(1), '%Y-%m-%d %H:%M:%S'))
         except:
             pass
 
     # Look for pattern like "timestamp: 1762982832"
-    match = re.search(r'timestamp[:\s]+(\d+)', error_message)
+    match = _TS_RE.search(error_message)
     if match:
         try:
             return int(match.group(1))
@@ -43,88 +128,183 @@ def parse_rate_limit_reset(error_message: str) -> int:
 
 
 def set_rate_limit_active(reset_timestamp: int):
-    """Store rate limit state in session."""
+    """Store rate limit state in session (only rewrites the cookie when it changes)."""
+    if session.get('rate_limit_active') and session.get('rate_limit_reset') == reset_timestamp:
+        return
+
     session['rate_limit_active'] = True
     session['rate_limit_reset'] = reset_timestamp
     session.modified = True
+    g._rate_limit_state = (True, reset_timestamp)
+
+
+def record_rate_limit_error(error_message: str):
+    """Mark the rate limit as active if the error message reports one."""
+    if _RATE_LIMIT_MARKER in error_message.lower():
+        reset_timestamp = parse_rate_limit_reset(error_message)
+        if reset_timestamp:
+            set_rate_limit_active(reset_timestamp)
 
 
 def check_rate_limit():
     """
-    Check if rate limit is active.
+    Check if rate limit is active (memoized on flask.g for the current request).
 
     Returns:
         tuple: (is_active, reset_timestamp)
     """
-    if not session.get('rate_limit_active'):
-        return False, 0
+    if '_rate_limit_state' in g:
+        return g._rate_limit_state
+
+    state = (False, 0)
+    if session.get('rate_limit_active'):
+        reset_timestamp = session.get('rate_limit_reset', 0)
+
+        # Check if rate limit has expired
+        if reset_timestamp and time.time() >= reset_timestamp:
+            session.pop('rate_limit_active', None)
+            session.pop('rate_limit_reset', None)
+            session.modified = True
+        else:
+            state = (True, reset_timestamp)
 
-    reset_timestamp = session.get('rate_limit_reset', 0)
+    g._rate_limit_state = state
+    return state
 
-    # Check if rate limit has expired
-    if reset_timestamp and datetime.now().timestamp() >= reset_timestamp:
-        session.pop('rate_limit_active', None)
-        session.pop('rate_limit_reset', None)
-        session.modified = True
-        return False, 0
 
-    return True, reset_timestamp
+def _guard_rate_limit():
+    """
+    Refuse a Twitter-backed action up front while a known rate limit is active.
 
+    Returns:
+        tuple: (JSON response, 429) if rate limited, otherwise None
+    """
+    rate_limit_active, rate_limit_reset = check_rate_limit()
+    if not rate_limit_active:
+        return None
 
-def store_rate_limit_info(twitter_service: TwitterService):
+    # Same wording as TwitterService errors so admin.js can parse the reset time
+    reset_str = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(rate_limit_reset))
+    return jsonify({
+        'success': False,
+        'message': f'Twitter API rate limit exceeded. Resets at {reset_str}. Please wait and try again.',
+        'reset': rate_limit_reset
+    }), 429
+
+
+def store_rate_limit_info(twitter_service: 'TwitterService'):
     """
     Store rate limit info from TwitterService in session.
 
     Args:
         twitter_service: TwitterService instance that just made an API call
+
+    Returns:
+        dict: Rate limit info from the last API call, or None
     """
     rate_limit_info = twitter_service.get_rate_limit_info()
-    if rate_limit_info:
+    # Skip unchanged values so the session cookie isn't re-signed for nothing
+    if rate_limit_info and rate_limit_info != get_rate_limit_info():
         session['twitter_rate_limit'] = rate_limit_info
         session.modified = True
+        g._rate_limit_info = rate_limit_info
+
+    return rate_limit_info
 
 
 def get_rate_limit_info():
     """
-    Get rate limit info from session.
+    Get rate limit info from session (memoized on flask.g for the current request).
 
     Returns:
         dict: Rate limit info or None
     """
-    return session.get('twitter_rate_limit')
+    if '_rate_limit_info' not in g:
+        g._rate_limit_info = session.get('twitter_rate_limit')
+    return g._rate_limit_info
+
+
+def get_sync_state():
+    """
+    Get the last sync and whether a new sync is allowed, cached for a few seconds.
+
+    Sync state only changes when a sync runs, so dashboard loads in between
+    reuse the cached values instead of querying sync_logs each time.
+
+    Returns:
+        tuple: (last_sync row with sync_started_at/status or None, can_sync, sync_message)
+    """
+    from app.services.sync_service import SyncService
+
+    now = time.monotonic()
+    if _sync_state_cache['value'] is None or now >= _sync_state_cache['expires']:
+        last_sync = db.session.query(
+            SyncLog.sync_started_at,
+            SyncLog.status
+        ).order_by(
+            SyncLog.sync_started_at.desc()
+        ).first()
+        can_sync, sync_message = SyncService.can_sync()
+
+        _sync_state_cache['value'] = (last_sync, can_sync, sync_message)
+        _sync_state_cache['expires'] = now + SYNC_STATE_TTL_SECONDS
+
+    return _sync_state_cache['value']
+
+
+def invalidate_sync_state():
+    """Drop the cached sync state after a sync starts or finishes."""
+    _sync_state_cache['value'] = None
 
 
 @bp.route('/')
 def dashboard():
     """Admin dashboard showing pending submissions and all list members"""
-    # Get pending submissions (oldest first, up to 10)
-    pending_submissions = Submission.query.filter_by(
+    # Get pending submissions (oldest first, up to 10), only the columns the table shows
+    pending_limit = 10
+    pending_submissions = Submission.query.options(
+        db.load_only(
+            Submission.id,
+            Submission.email,
+            Submission.twitter_handle,
+            Submission.submitted_at
+        )
+    ).filter_by(
         status=Submission.STATUS_PENDING
     ).order_by(
         Submission.submitted_at.asc()
-    ).limit(10).all()
+    ).limit(pending_limit).all()
 
-    # Get total count of pending
-    total_pending = Submission.query.filter_by(status=Submission.STATUS_PENDING).count()
+    # Get total count of pending (only needs a query when the list was truncated)
+    if len(pending_submissions) < pending_limit:
+        total_pending = len(pending_submissions)
+    else:
+        total_pending = Submission.query.filter_by(status=Submission.STATUS_PENDING).count()
 
     # Members list with pagination
     page = request.args.get('page', 1, type=int)
-    per_page = current_app.config.get('ITEMS_PER_PAGE', 20)
-
-    # Build members query
-    pagination = ListMember.query.order_by(
-        ListMember.synced_at.desc()
-    ).paginate(
-        page=page,
-        per_page=per_page,
-        error_out=False
+    per_page = _PER_PAGE
+
+    # Build members query (the table never renders the linked submission, so
+    # forbid lazy loads of it rather than paying one SELECT per row)
+    members_query = ListMember.query.options(
+        db.load_only(
+            ListMember.id,
+            ListMember.username,
+            ListMember.name,
+            ListMember.source,
+            ListMember.added_at,
+            ListMember.synced_at
+        ),
+        db.raiseload(ListMember.submission)
+    ).order_by(
+        ListMember.synced_at.desc(),
+        ListMember.id.desc()
     )
+    pagination = paginate_without_count(members_query, page, per_page)
 
-    # Get last sync info
-    last_sync = SyncLog.query.order_by(SyncLog.sync_started_at.desc()).first()
-
-    # Check if sync is allowed
-    can_sync, sync_message = SyncService.can_sync()
+    # Get last sync info and whether a sync is allowed
+    last_sync, can_sync, sync_message = get_sync_state()
 
     # Check rate limit status
     rate_limit_active, rate_limit_reset = check_rate_limit()
@@ -132,11 +312,14 @@ def dashboard():
     # Get rate limit info
     rate_limit_info = get_rate_limit_info()
 
-    # Get stats
+    # Get stats (one grouped query instead of a count per source)
+    counts_by_source = dict(
+        db.session.query(ListMember.source, func.count(ListMember.id)).group_by(ListMember.source).all()
+    )
     stats = {
-        'total': ListMember.query.count(),
-        'app_submitted': ListMember.query.filter_by(source=ListMember.SOURCE_APP_SUBMITTED).count(),
-        'pre_existing': ListMember.query.filter_by(source=ListMember.SOURCE_PRE_EXISTING).count(),
+        'total': sum(counts_by_source.values()),
+        'app_submitted': counts_by_source.get(ListMember.SOURCE_APP_SUBMITTED, 0),
+        'pre_existing': counts_by_source.get(ListMember.SOURCE_PRE_EXISTING, 0),
     }
 
     return render_template(
@@ -159,16 +342,24 @@ def dashboard():
 def pending():
     """List pending submissions with pagination"""
     page = request.args.get('page', 1, type=int)
-    per_page = current_app.config.get('ITEMS_PER_PAGE', 20)
-
-    pagination = Submission.query.filter_by(
-        status=Submission.STATUS_PENDING
-    ).order_by(
-        Submission.submitted_at.asc()
-    ).paginate(
-        page=page,
-        per_page=per_page,
-        error_out=False
+    per_page = _PER_PAGE
+
+    pagination = paginate_without_count(
+        Submission.query.options(
+            db.load_only(
+                Submission.id,
+                Submission.email,
+                Submission.twitter_handle,
+                Submission.submitted_at
+            )
+        ).filter_by(
+            status=Submission.STATUS_PENDING
+        ).order_by(
+            Submission.submitted_at.asc(),
+            Submission.id.asc()
+        ),
+        page,
+        per_page
     )
 
     return render_template('admin/pending.html', submissions=pagination.items, pagination=pagination)
@@ -177,7 +368,13 @@ def pending():
 @bp.route('/approve/<int:submission_id>', methods=['POST'])
 def approve(submission_id):
     """Approve a submission and add to Twitter list"""
-    submission = Submission.query.get_or_404(submission_id)
+    from app.services.twitter_service import TwitterService
+
+    rate_limited = _guard_rate_limit()
+    if rate_limited:
+        return rate_limited
+
+    submission = get_submission_or_404(submission_id)
 
     if submission.status != Submission.STATUS_PENDING:
         return jsonify({
@@ -194,9 +391,8 @@ def approve(submission_id):
             user_id = submission.twitter_user_id
         else:
             user_id = twitter.get_user_id(submission.twitter_handle)
-            # Cache the user_id for future use
+            # Cache the user_id for future use (saved with the approval below)
             submission.twitter_user_id = user_id
-            db.session.commit()
 
         # Add to Twitter list
         twitter.add_to_list(user_id)
@@ -204,7 +400,7 @@ def approve(submission_id):
         # Store rate limit info from the API call
         store_rate_limit_info(twitter)
 
-        # Update submission
+        # Update submission (single commit for the cached user_id and the approval)
         submission.approve(user_id)
         db.session.commit()
 
@@ -216,12 +412,7 @@ def approve(submission_id):
     except Exception as e:
         db.session.rollback()
         error_message = str(e)
-
-        # Check if this is a rate limit error
-        if 'rate limit exceeded' in error_message.lower():
-            reset_timestamp = parse_rate_limit_reset(error_message)
-            if reset_timestamp:
-                set_rate_limit_active(reset_timestamp)
+        record_rate_limit_error(error_message)
 
         return jsonify({
             'success': False,
@@ -232,7 +423,7 @@ def approve(submission_id):
 @bp.route('/reject/<int:submission_id>', methods=['POST'])
 def reject(submission_id):
     """Reject a submission"""
-    submission = Submission.query.get_or_404(submission_id)
+    submission = get_submission_or_404(submission_id)
 
     if submission.status != Submission.STATUS_PENDING:
         return jsonify({
@@ -261,6 +452,12 @@ def reject(submission_id):
 @bp.route('/bulk-approve', methods=['POST'])
 def bulk_approve():
     """Approve multiple submissions at once"""
+    from app.services.twitter_service import TwitterService
+
+    rate_limited = _guard_rate_limit()
+    if rate_limited:
+        return rate_limited
+
     if not request.is_json:
         return jsonify({
             'success': False,
@@ -282,8 +479,15 @@ def bulk_approve():
 
     twitter = TwitterService()
 
+    # Load all requested submissions in one query
+    submissions_by_id = {
+        s.id: s for s in Submission.query.filter(Submission.id.in_(submission_ids)).all()
+    }
+
+    # Validate submissions and collect the ones that can be approved
+    submissions = []
     for submission_id in submission_ids:
-        submission = Submission.query.get(submission_id)
+        submission = submissions_by_id.get(submission_id)
 
         if not submission:
             results['failed'].append({
@@ -300,47 +504,102 @@ def bulk_approve():
             })
             continue
 
-        try:
-            # Get Twitter user ID (use cached if available to save API calls)
-            if submission.twitter_user_id:
-                user_id = submission.twitter_user_id
-            else:
-                user_id = twitter.get_user_id(submission.twitter_handle)
-                # Cache the user_id for future use
-                submission.twitter_user_id = user_id
-                db.session.commit()
-
-            # Add to list
-            twitter.add_to_list(user_id)
+        submissions.append(submission)
 
-            # Store rate limit info from the API call
-            store_rate_limit_info(twitter)
+    # Every user ID to add; newly resolved ones are written with the bulk update
+    # below rather than set on the tracked submissions (which would flush a
+    # second UPDATE per row at commit)
+    user_ids_by_submission = {s.id: s.twitter_user_id for s in submissions if s.twitter_user_id}
 
-            # Update submission
-            submission.approve(user_id)
-            db.session.commit()
+    # Resolve all uncached user IDs with batched lookups (up to 100 handles per API call)
+    uncached = []
+    for submission in submissions:
+        if submission.twitter_user_id:
+            continue
 
-            results['success'].append({
-                'id': submission_id,
-                'handle': submission.twitter_handle
+        # users/by rejects a whole batch if any handle breaks Twitter's username
+        # format (older submissions were only length-checked), so fail those alone
+        if not Submission.is_valid_handle(submission.twitter_handle):
+            results['failed'].append({
+                'id': submission.id,
+                'handle': submission.twitter_handle,
+                'error': f"Invalid Twitter handle '@{submission.twitter_handle}'"
             })
+            continue
 
+        uncached.append(submission)
+
+    if uncached:
+        try:
+            user_ids, lookup_errors = twitter.get_user_ids_bulk([s.twitter_handle for s in uncached])
         except Exception as e:
-            db.session.rollback()
             error_message = str(e)
+            record_rate_limit_error(error_message)
+            user_ids, lookup_errors = {}, {s.twitter_handle: error_message for s in uncached}
 
-            # Check if this is a rate limit error
-            if 'rate limit exceeded' in error_message.lower():
-                reset_timestamp = parse_rate_limit_reset(error_message)
-                if reset_timestamp:
-                    set_rate_limit_active(reset_timestamp)
+        for submission in uncached:
+            user_id = user_ids.get(submission.twitter_handle)
+            if user_id:
+                user_ids_by_submission[submission.id] = user_id
+            else:
+                results['failed'].append({
+                    'id': submission.id,
+                    'handle': submission.twitter_handle,
+                    'error': lookup_errors.get(submission.twitter_handle, 'User not found')
+                })
+
+    submissions = [s for s in submissions if s.id in user_ids_by_submission]
+
+    # There is no bulk endpoint for list membership, so the service overlaps the
+    # per-user add_to_list calls (and fails fast once the rate limit is used up)
+    add_errors = twitter.add_to_list_many([user_ids_by_submission[s.id] for s in submissions])
+
+    pending_updates = []
+    now = datetime.utcnow()
+    for submission in submissions:
+        user_id = user_ids_by_submission[submission.id]
+        error = add_errors.get(user_id)
+
+        if error:
+            error_message = str(error)
+            record_rate_limit_error(error_message)
 
             results['failed'].append({
-                'id': submission_id,
+                'id': submission.id,
                 'handle': submission.twitter_handle,
                 'error': error_message
             })
 
+            # Still cache a newly resolved user_id for the next attempt
+            if not submission.twitter_user_id:
+                pending_updates.append({
+                    'id': submission.id,
+                    'twitter_user_id': user_id,
+                    'updated_at': now,
+                })
+            continue
+
+        # Queue the status change; written in bulk below
+        pending_updates.append({
+            'id': submission.id,
+            'twitter_user_id': user_id,
+            'status': Submission.STATUS_APPROVED,
+            'processed_at': now,
+            'updated_at': now,
+        })
+        results['success'].append({
+            'id': submission.id,
+            'handle': submission.twitter_handle
+        })
+
+    # Save cached user IDs and approvals in a single transaction
+    if pending_updates:
+        db.session.bulk_update_mappings(Submission, pending_updates)
+    db.session.commit()
+
+    # Store rate limit info from the API calls
+    store_rate_limit_info(twitter)
+
     return jsonify({
         'success': len(results['failed']) == 0,
         'message': f"Approved {len(results['success'])} submissions, {len(results['failed'])} failed",
@@ -351,7 +610,13 @@ def bulk_approve():
 @bp.route('/remove/<int:submission_id>', methods=['POST'])
 def remove(submission_id):
     """Remove a member from the Twitter list"""
-    submission = Submission.query.get_or_404(submission_id)
+    from app.services.twitter_service import TwitterService
+
+    rate_limited = _guard_rate_limit()
+    if rate_limited:
+        return rate_limited
+
+    submission = get_submission_or_404(submission_id)
 
     if submission.status != Submission.STATUS_APPROVED:
         return jsonify({
@@ -394,28 +659,43 @@ def search():
     query = request.args.get('q', '').strip()
     status = request.args.get('status', '').strip()
     page = request.args.get('page', 1, type=int)
-    per_page = current_app.config.get('ITEMS_PER_PAGE', 20)
-
-    # Build query
-    submissions_query = Submission.query
+    per_page = _PER_PAGE
+
+    # Build query (only the columns shown in the results table)
+    submissions_query = Submission.query.options(
+        db.load_only(
+            Submission.id,
+            Submission.email,
+            Submission.twitter_handle,
+            Submission.status,
+            Submission.submitted_at
+        )
+    )
 
     if query:
+        # Emails and handles are stored lowercased, so a case-sensitive LIKE on the
+        # lowercased term matches the same rows without case-folding every row.
+        # Substring terms shorter than a trigram can't narrow the trigram index,
+        # so match them as a prefix instead.
+        term = query.lower()
+        pattern = f'%{term}%' if len(term) >= 3 else f'{term}%'
         submissions_query = submissions_query.filter(
             db.or_(
-                Submission.email.ilike(f'%{query}%'),
-                Submission.twitter_handle.ilike(f'%{query}%')
+                Submission.email.like(pattern),
+                Submission.twitter_handle.like(pattern)
             )
         )
 
     if status:
         submissions_query = submissions_query.filter_by(status=status)
 
-    pagination = submissions_query.order_by(
-        Submission.submitted_at.desc()
-    ).paginate(
-        page=page,
-        per_page=per_page,
-        error_out=False
+    pagination = paginate_without_count(
+        submissions_query.order_by(
+            Submission.submitted_at.desc(),
+            Submission.id.desc()
+        ),
+        page,
+        per_page
     )
 
     return render_template(
@@ -429,18 +709,22 @@ def search():
 
 @bp.route('/sync', methods=['POST'])
 def sync():
-    """Trigger Twitter list sync"""
+    """Start a Twitter list sync in the background"""
+    from app.services.sync_service import SyncService
+
+    rate_limited = _guard_rate_limit()
+    if rate_limited:
+        return rate_limited
+
     try:
-        result = SyncService.sync_list_members()
+        sync_log = SyncService.start_sync()
+        invalidate_sync_state()
 
         return jsonify({
             'success': True,
-            'message': f"Sync completed: {result['members_fetched']} fetched, "
-                      f"{result['members_added']} added, "
-                      f"{result['members_updated']} updated, "
-                      f"{result['members_removed']} removed",
-            'result': result
-        })
+            'message': 'Sync started',
+            'sync_id': sync_log.id
+        }), 202
 
     except Exception as e:
         return jsonify({
@@ -449,19 +733,53 @@ def sync():
         }), 500
 
 
+@bp.route('/sync/<int:sync_id>')
+def sync_status(sync_id):
+    """Report the progress of a background sync"""
+    from app.services.sync_service import SyncService
+
+    sync_log = SyncLog.query.get_or_404(sync_id)
+
+    # A sync whose worker died never finishes; stop it being polled forever
+    SyncService.fail_if_stale(sync_log)
+
+    if sync_log.status == SyncLog.STATUS_COMPLETED:
+        message = (f"Sync completed: {sync_log.members_fetched} fetched, "
+                   f"{sync_log.members_added} added, "
+                   f"{sync_log.members_updated} updated, "
+                   f"{sync_log.members_removed} removed")
+    elif sync_log.status == SyncLog.STATUS_FAILED:
+        message = f'Sync failed: {sync_log.error_message}'
+    else:
+        message = 'Sync in progress'
+
+    if sync_log.status != SyncLog.STATUS_IN_PROGRESS:
+        invalidate_sync_state()
+
+    return jsonify({
+        'success': sync_log.status != SyncLog.STATUS_FAILED,
+        'done': sync_log.status != SyncLog.STATUS_IN_PROGRESS,
+        'message': message,
+        'result': sync_log.to_dict()
+    })
+
+
 @bp.route('/check-rate-limit', methods=['POST'])
 def check_rate_limit_status():
     """Check current rate limit status by making a lightweight API call"""
+    from app.services.twitter_service import TwitterService
+
+    rate_limited = _guard_rate_limit()
+    if rate_limited:
+        return rate_limited
+
     try:
         twitter = TwitterService()
         # Make a lightweight API call to refresh rate limit info
         twitter.get_list_info()
 
         # Store rate limit info from the API call
-        store_rate_limit_info(twitter)
-
-        # Get the updated rate limit info
-        rate_limit_info = get_rate_limit_info()
+        rate_limit_info = store_rate_limit_info(twitter)
 
         if rate_limit_info:
             return jsonify({
@@ -485,7 +803,16 @@ def check_rate_limit_status():
 @bp.route('/remove-member/<int:member_id>', methods=['POST'])
 def remove_member(member_id):
     """Remove a member from the Twitter list and database"""
-    member = ListMember.query.get_or_404(member_id)
+    from app.services.twitter_service import TwitterService
+
+    rate_limited = _guard_rate_limit()
+    if rate_limited:
+        return rate_limited
+
+    # Load the linked submission in the same query, it is updated below
+    member = ListMember.query.options(
+        db.joinedload(ListMember.submission)
+    ).filter_by(id=member_id).first_or_404()
 
     try:
         # Remove from Twitter list
@@ -518,14 +845,12 @@ def remove_member(member_id):
 def sync_history():
     """View sync history"""
     page = request.args.get('page', 1, type=int)
-    per_page = current_app.config.get('ITEMS_PER_PAGE', 20)
-
-    pagination = SyncLog.query.order_by(
-        SyncLog.sync_started_at.desc()
-    ).paginate(
-        page=page,
-        per_page=per_page,
-        error_out=False
+    per_page = _PER_PAGE
+
+    pagination = paginate_without_count(
+        SyncLog.query.order_by(SyncLog.sync_started_at.desc()),
+        page,
+        per_page
     )
 
     return render_template(
@@ -1,11 +1,15 @@
 from flask import Blueprint, render_template, request, flash, redirect, url_for
 from sqlalchemy.exc import IntegrityError
 from email_validator import validate_email, EmailNotValidError
+import re
 from app import db
-from app.models import Submission
+from app.models import Submission, ListMember
 
 bp = Blueprint('public', __name__)
 
+# One handle per line; also handles CRLF line endings from Windows pastes
+_SPLIT_RE = re.compile(r'[\r\n]+')
+
 
 @bp.route('/')
 def index():
@@ -45,16 +49,26 @@ def submit():
 
     # Parse handles (split by newlines, strip whitespace, remove @ symbols)
     handles = []
-    for line in twitter_handles_text.split('\n'):
+    invalid_handles = []
+    for line in _SPLIT_RE.split(twitter_handles_text):
         handle = line.strip().lstrip('@')
         if handle:  # Skip empty lines
-            # Validate handle length
-            if len(handle) < 1 or len(handle) > 15:
-                flash(f"Twitter handle '{handle}' must be between 1 and 15 characters", 'error')
-                return render_template('index.html'), 400
+            # Validate handle format before it ever reaches the Twitter API
+            if not Submission.is_valid_handle(handle):
+                invalid_handles.append(handle)
+                continue
             handles.append(handle)
 
-    if not handles:
+    if invalid_handles:
+        flash('Invalid: ' + ', '.join(f"'{handle}'" for handle in invalid_handles) +
+              ' (handles must be 1-15 letters, numbers or underscores)', 'error')
+
+    # Drop repeats (case and @ prefix don't matter), keeping the first spelling
+    unique_handles = {}
+    for handle in handles:
+        unique_handles.setdefault(Submission.normalize_handle(handle), handle)
+
+    if not unique_handles:
         flash("No valid Twitter handles found", 'error')
         return render_template('index.html'), 400
 
@@ -65,12 +79,17 @@ def submit():
         'failed': []
     }
 
-    for handle in handles:
-        # Normalize handle for comparison
-        normalized_handle = Submission.normalize_handle(handle)
+    # Look up existing submissions for all handles in one query
+    existing_submissions = {
+        s.twitter_handle: s
+        for s in Submission.query.filter(Submission.twitter_handle.in_(list(unique_handles))).all()
+    }
 
-        # Check if submission already exists
-        existing_submission = Submission.query.filter_by(twitter_handle=normalized_handle).first()
+    to_insert = []
+    rejected_ids = []
+
+    for normalized_handle, handle in unique_handles.items():
+        existing_submission = existing_submissions.get(normalized_handle)
 
         if existing_submission:
             if existing_submission.status == Submission.STATUS_PENDING:
@@ -87,47 +106,37 @@ def submit():
                 continue
             # If rejected, allow re-submission by deleting the old one
             else:
-                try:
-                    db.session.delete(existing_submission)
-                    db.session.flush()  # Ensure deletion happens before insert
-                except Exception as e:
-                    db.session.rollback()
-                    results['failed'].append({
-                        'handle': handle,
-                        'error': f"Failed to delete old submission: {str(e)}"
-                    })
-                    continue
+                rejected_ids.append(existing_submission.id)
+
+        to_insert.append(handle)
 
+    if to_insert:
         try:
-            # Create submission
-            submission = Submission(
-                email=email,
-                twitter_handle=handle
-            )
-            db.session.add(submission)
+            # Delete rejected submissions before inserting their replacements
+            if rejected_ids:
+                # Members removed from the list keep pointing at their rejected
+                # submission until the next sync; unlink them so the delete passes
+                ListMember.query.filter(ListMember.submission_id.in_(rejected_ids)).update(
+                    {'submission_id': None}, synchronize_session=False
+                )
+                Submission.query.filter(Submission.id.in_(rejected_ids)).delete(synchronize_session=False)
+                db.session.flush()
+
+            # Create all submissions in a single transaction
+            db.session.add_all([Submission(email=email, twitter_handle=h) for h in to_insert])
             db.session.commit()
 
-            results['success'].append(handle)
+            results['success'].extend(to_insert)
 
         except Exception as e:
             db.session.rollback()
-            results['failed'].append({
-                'handle': handle,
-                'error': str(e)
-            })
-
-    # Show summary message
-    message_parts = []
-    if results['success']:
-        handles_str = ", ".join([f"@{h}" for h in results['success']])
-        message_parts.append(f"Successfully submitted: {handles_str}")
-    if results['skipped']:
-        for item in results['skipped']:
-            message_parts.append(f"@{item['handle']} - {item['reason']}")
-    if results['failed']:
-        for item in results['failed']:
-            message_parts.append(f"@{item['handle']} - Error: {item['error']}")
+            for handle in to_insert:
+                results['failed'].append({
+                    'handle': handle,
+                    'error': str(e)
+                })
 
+    # Show summary messages (one flash per outcome)
     if results['success']:
         flash(
             f"Thank you! {len(results['success'])} handle(s) submitted successfully. "
@@ -135,8 +144,14 @@ def submit():
             'success'
         )
 
-    if results['skipped'] or results['failed']:
-        for msg in message_parts[len(results['success']):]:
-            flash(msg, 'error')
+    if results['skipped']:
+        flash('Skipped: ' + '; '.join(
+            f"@{item['handle']} ({item['reason']})" for item in results['skipped']
+        ), 'error')
+
+    if results['failed']:
+        flash('Failed: ' + '; '.join(
+            f"@{item['handle']} (Error: {item['error']})" for item in results['failed']
+        ), 'error')
 
     return redirect(url_for('public.index'))
@@ -1,12 +1,18 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from flask import current_app
+from sqlalchemy import select, update, delete, func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app import db
 from app.models import ListMember, SyncLog, Submission
 from app.services.twitter_service import TwitterService
 
 logger = logging.getLogger(__name__)
 
+# Background worker for list syncs; one at a time per process
+_sync_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='list-sync')
+
 
 class SyncService:
     """Service for syncing Twitter list members with the database"""
@@ -21,15 +27,15 @@ class SyncService:
         """
         cooloff_minutes = current_app.config.get('SYNC_COOLOFF_MINUTES', 5)
 
-        # Get the last sync log
-        last_sync = SyncLog.query.order_by(SyncLog.sync_started_at.desc()).first()
+        # Get when the last sync started (a single index probe, no row loaded)
+        last_started = db.session.execute(select(func.max(SyncLog.sync_started_at))).scalar()
 
-        if not last_sync:
+        if last_started is None:
             return True, "No previous sync found"
 
         # Check if cooloff period has passed
         cooloff_delta = timedelta(minutes=cooloff_minutes)
-        time_since_last_sync = datetime.utcnow() - last_sync.sync_started_at
+        time_since_last_sync = datetime.utcnow() - last_started
 
         if time_since_last_sync < cooloff_delta:
             remaining = cooloff_delta - time_since_last_sync
@@ -39,15 +45,18 @@ class SyncService:
         return True, "Sync allowed"
 
     @staticmethod
-    def sync_list_members() -> dict:
+    def _begin_sync(commit: bool = True) -> SyncLog:
         """
-        Sync Twitter list members with the database.
+        Check the cooloff period and record a new in-progress sync.
+
+        Args:
+            commit: Commit the sync log now; otherwise only flush it to get its id
 
         Returns:
-            dict: Sync results with statistics
+            SyncLog: Sync log for the new sync
 
         Raises:
-            Exception: If sync operation fails
+            Exception: If a sync is not allowed yet
         """
         # Check if sync is allowed
         can_sync, message = SyncService.can_sync()
@@ -60,85 +69,140 @@ class SyncService:
             status=SyncLog.STATUS_IN_PROGRESS
         )
         db.session.add(sync_log)
-        db.session.commit()
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
 
-        try:
-            # Fetch members from Twitter API
-            twitter_service = TwitterService()
-            twitter_members = twitter_service.get_list_members()
+        return sync_log
 
-            sync_log.members_fetched = len(twitter_members)
-            db.session.commit()
+    @staticmethod
+    def start_sync() -> SyncLog:
+        """
+        Start a sync on a background thread so the request doesn't wait on the Twitter API.
 
-            # Create lookup dictionaries
-            twitter_user_ids = {member['id'] for member in twitter_members}
-            db_members = {m.twitter_user_id: m for m in ListMember.query.all()}
+        The returned sync log is committed as in progress; poll it for the outcome.
 
-            members_added = 0
-            members_updated = 0
-            members_removed = 0
+        Returns:
+            SyncLog: Log entry tracking the background sync
+
+        Raises:
+            Exception: If a sync is not allowed yet
+        """
+        sync_log = SyncService._begin_sync()
 
-            # Process Twitter members
-            for twitter_member in twitter_members:
-                user_id = twitter_member['id']
-                username = twitter_member['username']
-                name = twitter_member.get('name', '')
+        app = current_app._get_current_object()
+        _sync_executor.submit(SyncService._run_background_sync, app, sync_log.id)
 
-                if user_id in db_members:
-                    # Update existing member
-                    db_member = db_members[user_id]
-                    updated = False
+        return sync_log
 
-                    if db_member.username != username:
-                        db_member.username = username
-                        updated = True
+    @staticmethod
+    def _run_background_sync(app, sync_log_id: int):
+        """Run a sync for an existing sync log inside its own app context."""
+        with app.app_context():
+            try:
+                sync_log = db.session.get(SyncLog, sync_log_id)
+                if sync_log is None:
+                    logger.error("Background sync %s not started: sync log not found", sync_log_id)
+                    return
+                SyncService.sync_list_members(sync_log)
+            except Exception:
+                # Usually already recorded on the sync log, but recording it may have failed too
+                logger.exception("Background sync %s failed", sync_log_id)
+            finally:
+                db.session.remove()
 
-                    if db_member.name != name:
-                        db_member.name = name
-                        updated = True
+    @staticmethod
+    def fail_if_stale(sync_log: SyncLog) -> bool:
+        """
+        Mark an in-progress sync as failed if it has run past SYNC_TIMEOUT_MINUTES.
 
-                    # Always update synced_at
-                    db_member.synced_at = datetime.utcnow()
+        A sync whose worker died (or failed to record its own failure) would
+        otherwise stay in progress forever and be polled indefinitely.
 
-                    if updated:
-                        members_updated += 1
-                        logger.info(f"Updated member @{username}")
-                else:
-                    # Add new member
-                    # Check if this user has a submission
-                    submission = Submission.query.filter_by(
-                        twitter_user_id=user_id
-                    ).first()
-
-                    # Determine source based on submission
-                    if submission:
-                        # Check if it was bulk-added (email is the placeholder)
-                        if submission.email == 'bulk-added@system':
-                            source = ListMember.SOURCE_BULK_ADDED
-                        else:
-                            source = ListMember.SOURCE_APP_SUBMITTED
-                    else:
-                        source = ListMember.SOURCE_PRE_EXISTING
-
-                    new_member = ListMember(
-                        twitter_user_id=user_id,
-                        username=username,
-                        name=name,
-                        source=source,
-                        submission_id=submission.id if submission else None,
-                        added_at=datetime.utcnow(),
-                        synced_at=datetime.utcnow()
-                    )
-                    db.session.add(new_member)
-                    members_added += 1
-                    logger.info(f"Added new member @{username} (source: {source})")
+        Args:
+            sync_log: Sync log to check
 
-            # Remove members no longer on Twitter list
-            for db_user_id, db_member in db_members.items():
-                if db_user_id not in twitter_user_ids:
-                    logger.info(f"Removing member @{db_member.username} (no longer on Twitter list)")
-                    db.session.delete(db_member)
-                    members_removed += 1
+        Returns:
+            bool: True if the sync log was marked as failed
+        """
+        timeout_minutes = current_app.config.get('SYNC_TIMEOUT_MINUTES', 30)
+
+        if sync_log.status != SyncLog.STATUS_IN_PROGRESS:
+            return False
+        if datetime.utcnow() - sync_log.sync_started_at < timedelta(minutes=timeout_minutes):
+            return False
+
+        sync_log.status = SyncLog.STATUS_FAILED
+        sync_log.error_message = f"Sync did not finish within {timeout_minutes} minutes"
+        sync_log.sync_completed_at = datetime.utcnow()
+        db.session.commit()
+
+        logger.warning("Marked stale sync %s as failed", sync_log.id)
+        return True
+
+    @staticmethod
+    def sync_list_members(sync_log: SyncLog = None) -> dict:
+        """
+        Sync Twitter list members with the database.
+
+        Args:
+            sync_log: In-progress sync log to record results on (started here if omitted)
+
+        Returns:
+            dict: Sync results with statistics
+
+        Raises:
+            Exception: If sync operation fails
+        """
+        # A background sync's log is already committed so it can be polled; a direct
+        # sync only flushes its log and is persisted by the single final commit
+        if sync_log is None:
+            sync_log = SyncService._begin_sync(commit=False)
+
+        try:
+            # Fetch members from Twitter API and write each page as it arrives,
+            # so only one page of members is held in memory at a time
+            # Syncs run in the background, so they can wait out short rate limits
+            twitter_service = TwitterService(
+                max_rate_limit_wait=current_app.config.get('TWITTER_MAX_429_WAIT', 90)
+            )
+            now = datetime.utcnow()
+            twitter_user_ids = set()
+            members_fetched = 0
+            members_added = 0
+            members_updated = 0
+
+            for page_members in twitter_service.iter_list_members():
+                members_fetched += len(page_members)
+                twitter_user_ids.update(int(member['id']) for member in page_members)
+
+                added, updated = SyncService._upsert_members(page_members, now)
+                members_added += added
+                members_updated += updated
+
+            sync_log.members_fetched = members_fetched
+
+            # Remove members no longer on Twitter list with one set-difference DELETE
+            removed = db.session.execute(
+                delete(ListMember)
+                .where(~ListMember.twitter_user_id.in_(twitter_user_ids))
+                .returning(ListMember.username)
+            ).scalars().all()
+
+            for username in removed:
+                logger.info("Removed member @%s (no longer on Twitter list)", username)
+            members_removed = len(removed)
+
+            # Only the members still on the list remain, so stamp them all in one
+            # statement - and skip it entirely when the list did not change, so a
+            # no-op sync writes nothing but its own log row
+            if members_added or members_updated or members_removed:
+                db.session.execute(
+                    update(ListMember)
+                    .where(ListMember.synced_at != now)
+                    .values(synced_at=now)
+                )
 
             # Update sync log
             sync_log.members_added = members_added
@@ -158,19 +222,109 @@ class SyncService:
                 'sync_id': sync_log.id
             }
 
-            logger.info(f"Sync completed successfully: {result}")
+            logger.info("Sync completed successfully: %s", result)
             return result
 
         except Exception as e:
-            # Mark sync as failed
+            # Discard the partial sync, then mark it as failed in a fresh transaction
+            # (re-adding the log, which the rollback drops if it was only flushed)
+            db.session.rollback()
+            db.session.add(sync_log)
             sync_log.status = SyncLog.STATUS_FAILED
             sync_log.error_message = str(e)
             sync_log.sync_completed_at = datetime.utcnow()
             db.session.commit()
 
-            logger.error(f"Sync failed: {str(e)}")
+            logger.error("Sync failed: %s", e)
             raise
 
+    @staticmethod
+    def _upsert_members(page_members: list, now: datetime) -> tuple[int, int]:
+        """
+        Insert or update one page of Twitter list members.
+
+        Args:
+            page_members: Member dictionaries with 'id', 'username', and 'name'
+            now: Sync timestamp used for added_at/synced_at on every row
+
+        Returns:
+            tuple: (members_added, members_updated)
+        """
+        user_ids = {int(member['id']) for member in page_members}
+
+        # Look up the submissions behind all fetched members in one query
+        # (only the columns needed to pick a source, not full ORM rows)
+        submissions_by_user_id = {
+            row.twitter_user_id: row
+            for row in db.session.query(
+                Submission.twitter_user_id,
+                Submission.id,
+                Submission.email
+            ).filter(Submission.twitter_user_id.in_(user_ids))
+        }
+
+        # Keyed by user id: a member repeated in the page must appear once in the upsert
+        rows = {}
+        for twitter_member in page_members:
+            user_id = int(twitter_member['id'])
+            submission = submissions_by_user_id.get(user_id)
+
+            # Determine source based on submission (only used for new members)
+            if submission:
+                # Check if it was bulk-added (email is the placeholder)
+                if submission.email == 'bulk-added@system':
+                    source = ListMember.SOURCE_BULK_ADDED
+                else:
+                    source = ListMember.SOURCE_APP_SUBMITTED
+            else:
+                source = ListMember.SOURCE_PRE_EXISTING
+
+            rows[user_id] = {
+                'twitter_user_id': user_id,
+                'username': twitter_member['username'],
+                'name': twitter_member.get('name', ''),
+                'source': source,
+                'submission_id': submission.id if submission else None,
+                'added_at': now,
+                'synced_at': now
+            }
+
+        members_added = 0
+        members_updated = 0
+
+        if rows:
+            # Insert new members and update changed usernames/names in one statement;
+            # unchanged rows are left alone so RETURNING only reports real changes
+            # (xmax is 0 for freshly inserted rows)
+            stmt = pg_insert(ListMember).values(list(rows.values()))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ListMember.twitter_user_id],
+                # ON CONFLICT skips the column's onupdate, so bump updated_at here
+                set_={
+                    'username': stmt.excluded.username,
+                    'name': stmt.excluded.name,
+                    'updated_at': now,
+                },
+                where=db.or_(
+                    ListMember.username.is_distinct_from(stmt.excluded.username),
+                    ListMember.name.is_distinct_from(stmt.excluded.name)
+                )
+            ).returning(
+                ListMember.username,
+                ListMember.source,
+                (literal_column('xmax') == 0).label('inserted')
+            )
+
+            for username, source, inserted in db.session.execute(stmt):
+                if inserted:
+                    members_added += 1
+                    logger.info("Added new member @%s (source: %s)", username, source)
+                else:
+                    members_updated += 1
+                    logger.info("Updated member @%s", username)
+
+        return members_added, members_updated
+
     @staticmethod
     def get_sync_history(limit: int = 10) -> list:
         """
@@ -182,8 +336,28 @@ class SyncService:
         Returns:
             list: List of sync log dictionaries
         """
-        sync_logs = SyncLog.query.order_by(
-            SyncLog.sync_started_at.desc()
-        ).limit(limit).all()
-
-        return [log.to_dict() for log in sync_logs]
+        # Plain rows instead of ORM objects; the dicts match SyncLog.to_dict()
+        rows = db.session.execute(
+            select(
+                SyncLog.id,
+                SyncLog.sync_started_at,
+                SyncLog.sync_completed_at,
+                SyncLog.members_fetched,
+                SyncLog.members_added,
+                SyncLog.members_removed,
+                SyncLog.members_updated,
+                SyncLog.status,
+                SyncLog.error_message
+            ).order_by(
+                SyncLog.sync_started_at.desc()
+            ).limit(limit)
+        ).mappings()
+
+        history = []
+        for row in rows:
+            log = dict(row)
+            for key in ('sync_started_at', 'sync_completed_at'):
+                log[key] = log[key].isoformat() if log[key] else None
+            history.append(log)
+
+        return history
@@ -1,27 +1,118 @@
 import os
+import functools
 import logging
+import threading
+import time
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests_oauthlib import OAuth1
 from flask import current_app
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so connections to the Twitter API are kept alive and reused
+# across requests and across the threads used for bulk operations. Transient 5xx
+# errors are retried with backoff; 429s are left to the rate limit handling below.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504], raise_on_status=False),
+))
+
+
+class _RateLimiter:
+    """
+    In-process token bucket per Twitter endpoint, refilled from x-rate-limit-* headers.
+
+    Each call takes a token from the endpoint's current window so concurrent
+    callers never send more requests than the window has left. Once it is
+    empty, calls fail fast until the reset time instead of being sent only
+    to come back as 429s.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._windows = {}  # endpoint -> [remaining, reset timestamp]
+
+    def acquire(self, endpoint: str) -> int:
+        """
+        Take a token for an endpoint.
+
+        Returns:
+            int: Reset timestamp if the window is exhausted, otherwise 0
+        """
+        with self._lock:
+            window = self._windows.get(endpoint)
+            if window is None:
+                return 0
+
+            remaining, reset = window
+            if reset <= time.time():
+                # Window has rolled over; the next response will report the new one
+                del self._windows[endpoint]
+                return 0
+
+            if remaining <= 0:
+                return reset
+
+            window[0] = remaining - 1
+            return 0
+
+    def update(self, endpoint: str, response):
+        """Refill an endpoint's window from the headers of a response."""
+        try:
+            remaining = int(response.headers['x-rate-limit-remaining'])
+            reset = int(response.headers['x-rate-limit-reset'])
+        except (KeyError, ValueError, TypeError):
+            return
+
+        with self._lock:
+            self._windows[endpoint] = [remaining, reset]
+
+
+_rate_limiter = _RateLimiter()
+
+# Tries per call when rate limited windows are waited out (see TwitterService._request)
+RATE_LIMIT_ATTEMPTS = 3
+
+
+@functools.lru_cache(maxsize=1)
+def _get_oauth(api_key: str, api_secret: str, access_token: str, access_token_secret: str) -> OAuth1:
+    """Build the OAuth1 signer once per set of credentials (it holds no per-request state)."""
+    return OAuth1(api_key, api_secret, access_token, access_token_secret)
+
 
 class TwitterService:
     """Service for interacting with Twitter API v2"""
 
     BASE_URL = "https://api.twitter.com/2"
 
-    def __init__(self):
-        """Initialize Twitter API authentication"""
-        self.auth = OAuth1(
+    def __init__(self, max_rate_limit_wait: int = 0):
+        """
+        Initialize Twitter API authentication.
+
+        Args:
+            max_rate_limit_wait: Longest rate limit reset (seconds) to sleep through
+                                 before retrying; 0 fails fast, which request
+                                 handlers rely on to answer within the worker timeout
+        """
+        self.auth = _get_oauth(
             current_app.config['TWITTER_API_KEY'],
             current_app.config['TWITTER_API_SECRET'],
             current_app.config['TWITTER_ACCESS_TOKEN'],
             current_app.config['TWITTER_ACCESS_TOKEN_SECRET'],
         )
         self.list_id = current_app.config['TWITTER_LIST_ID']
+        # List endpoints are fixed per instance; build them once
+        self._list_url = f"{self.BASE_URL}/lists/{self.list_id}"
+        self._members_url = f"{self._list_url}/members"
+        self.concurrency = current_app.config.get('TWITTER_CONCURRENCY', 8)
+        self.max_rate_limit_wait = max_rate_limit_wait
         self.last_rate_limit_info = None
 
     def _extract_rate_limit_info(self, response) -> dict:
@@ -60,7 +151,107 @@ class TwitterService:
         """
         return self.last_rate_limit_info
 
-    def get_user_id(self, username: str) -> str:
+    def _request(self, method: str, url: str, endpoint: str, context: str, **kwargs):
+        """
+        Send a request through the shared session and rate limiter.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            endpoint: Rate limit bucket for the endpoint (Twitter limits per endpoint)
+            context: Description of the call for log and error messages
+            **kwargs: Passed through to requests
+
+        Returns:
+            requests.Response object
+
+        If the service was created with a max_rate_limit_wait, rate limit windows
+        that reset within it are waited out and the call retried, so long syncs
+        keep going.
+
+        Raises:
+            Exception: If the request is rate limited, or the endpoint's rate limit
+                       window is already known to be exhausted, and the reset is
+                       too far away to wait for
+        """
+        for attempt in range(RATE_LIMIT_ATTEMPTS):
+            can_wait = self.max_rate_limit_wait > 0 and attempt < RATE_LIMIT_ATTEMPTS - 1
+
+            reset = _rate_limiter.acquire(endpoint)
+            if reset:
+                if can_wait and self._wait_for_reset(context, reset):
+                    continue
+                self._raise_rate_limit_error(context, reset, 0)
+
+            response = _session.request(method, url, auth=self.auth, **kwargs)
+
+            # Capture rate limit info from response
+            _rate_limiter.update(endpoint, response)
+            self._extract_rate_limit_info(response)
+
+            if response.status_code == 429:
+                rate_limit_reset = response.headers.get('x-rate-limit-reset', 'unknown')
+                if can_wait and self._wait_for_reset(context, rate_limit_reset):
+                    continue
+                self._raise_rate_limit_error(
+                    context,
+                    rate_limit_reset,
+                    response.headers.get('x-rate-limit-remaining', 'unknown')
+                )
+
+            return response
+
+    def _wait_for_reset(self, context: str, rate_limit_reset) -> bool:
+        """
+        Sleep until a rate limit window resets, if it resets soon enough.
+
+        Args:
+            context: Description of the call that was rate limited
+            rate_limit_reset: Reset timestamp (from x-rate-limit-reset)
+
+        Returns:
+            bool: True if we waited and the call should be retried, False to give up
+        """
+        try:
+            wait = int(rate_limit_reset) - time.time()
+        except (ValueError, TypeError):
+            return False
+
+        if wait > self.max_rate_limit_wait:
+            return False
+
+        logger.warning("Rate limited: %s. Waiting %.0fs for the window to reset", context, max(wait, 0))
+        # One extra second so the retry lands after the reset, not on it
+        time.sleep(max(wait, 0) + 1)
+        return True
+
+    def _raise_rate_limit_error(self, context: str, rate_limit_reset, remaining):
+        """
+        Log a rate limit hit and raise an exception describing when it resets.
+
+        Args:
+            context: Description of the call that was rate limited
+            rate_limit_reset: Reset timestamp (from x-rate-limit-reset)
+            remaining: Requests remaining (from x-rate-limit-remaining)
+
+        Raises:
+            Exception: Always
+        """
+        # Convert reset timestamp to readable time
+        reset_time = None
+        try:
+            reset_time = datetime.fromtimestamp(int(rate_limit_reset), tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            logger.error("Rate limit exceeded: %s. Remaining: %s, Reset at: %s (timestamp: %s)", context, remaining, reset_time, rate_limit_reset)
+        except (ValueError, TypeError):
+            logger.error("Rate limit exceeded: %s. Remaining: %s, Reset: %s", context, remaining, rate_limit_reset)
+
+        # Raise exception with or without reset time
+        if reset_time:
+            raise Exception(f"Twitter API rate limit exceeded. Resets at {reset_time}. Please wait and try again.")
+        else:
+            raise Exception("Twitter API rate limit exceeded. Please try again later.")
+
+    def get_user_id(self, username: str) -> int:
         """
         Look up the user ID for a given Twitter handle.
 
@@ -68,7 +259,7 @@ class TwitterService:
             username: Twitter handle (with or without @)
 
         Returns:
-            str: Twitter user ID
+            int: Twitter user ID
 
         Raises:
             Exception: If user not found or API error occurs
@@ -79,48 +270,86 @@ class TwitterService:
         url = f"{self.BASE_URL}/users/by/username/{username}"
 
         try:
-            response = requests.get(url, auth=self.auth)
-
-            # Capture rate limit info from response
-            self._extract_rate_limit_info(response)
+            response = self._request("GET", url, "users/by/username", f"get_user_id(@{username})")
 
             if response.status_code == 404:
                 raise Exception(f"User '@{username}' not found")
 
-            if response.status_code == 429:
-                rate_limit_reset = response.headers.get('x-rate-limit-reset', 'unknown')
-                remaining = response.headers.get('x-rate-limit-remaining', 'unknown')
-
-                # Convert reset timestamp to readable time
-                reset_time = None
-                try:
-                    reset_time = datetime.fromtimestamp(int(rate_limit_reset), tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-                    logger.error(f"Rate limit exceeded: get_user_id(@{username}). Remaining: {remaining}, Reset at: {reset_time} (timestamp: {rate_limit_reset})")
-                except (ValueError, TypeError):
-                    logger.error(f"Rate limit exceeded: get_user_id(@{username}). Remaining: {remaining}, Reset: {rate_limit_reset}")
-
-                # Raise exception with or without reset time
-                if reset_time:
-                    raise Exception(f"Twitter API rate limit exceeded. Resets at {reset_time}. Please wait and try again.")
-                else:
-                    raise Exception("Twitter API rate limit exceeded. Please try again later.")
-
             if response.status_code != 200:
-                logger.error(f"Twitter API error: {response.status_code} - {response.text}")
+                logger.error("Twitter API error: %s - %s", response.status_code, response.text)
                 raise Exception(f"Error fetching user: {response.status_code}")
 
-            data = response.json().get("data")
+            data = orjson.loads(response.content).get("data")
             if not data:
                 raise Exception(f"User '@{username}' not found")
 
-            logger.info(f"Found user ID {data['id']} for @{username}")
-            return data["id"]
+            logger.info("Found user ID %s for @%s", data['id'], username)
+            return int(data["id"])
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {str(e)}")
+            logger.error("Request error: %s", e)
             raise Exception(f"Network error while fetching user: {str(e)}")
 
-    def add_to_list(self, user_id: str) -> bool:
+    def get_user_ids_bulk(self, usernames: list) -> tuple[dict, dict]:
+        """
+        Look up user IDs for many Twitter handles using the batched users/by endpoint.
+
+        Handles are sent in chunks of up to 100 per request, so N lookups cost
+        ceil(N/100) API calls instead of N.
+
+        Args:
+            usernames: Twitter handles (with or without @)
+
+        Returns:
+            tuple: (user_ids, errors) where user_ids maps lowercase handle to user ID
+                   and errors maps lowercase handle to an error message
+
+        Raises:
+            Exception: If rate limited or a request-level API error occurs
+        """
+        handles = [username.lstrip('@').lower() for username in usernames]
+        url = f"{self.BASE_URL}/users/by"
+        batch_size = 100  # Twitter API max usernames per request
+
+        user_ids = {}
+        errors = {}
+
+        try:
+            for start in range(0, len(handles), batch_size):
+                batch = handles[start:start + batch_size]
+                response = self._request(
+                    "GET", url, "users/by", f"get_user_ids_bulk({len(batch)} handles)",
+                    params={"usernames": ",".join(batch)}
+                )
+
+                if response.status_code != 200:
+                    logger.error("Twitter API error: %s - %s", response.status_code, response.text)
+                    raise Exception(f"Error fetching users: {response.status_code}")
+
+                data = orjson.loads(response.content)
+
+                for user in data.get("data", []):
+                    user_ids[user["username"].lower()] = int(user["id"])
+
+                # Per-handle failures (e.g. not found, suspended) come back in errors[]
+                for error in data.get("errors", []):
+                    handle = str(error.get("value", "")).lower()
+                    if handle:
+                        errors[handle] = error.get("detail") or error.get("title") or "User not found"
+
+            # Anything neither found nor reported is treated as not found
+            for handle in handles:
+                if handle not in user_ids and handle not in errors:
+                    errors[handle] = f"User '@{handle}' not found"
+
+            logger.info("Resolved %s of %s handles (%s failed)", len(user_ids), len(handles), len(errors))
+            return user_ids, errors
+
+        except requests.exceptions.RequestException as e:
+            logger.error("Request error: %s", e)
+            raise Exception(f"Network error while fetching users: {str(e)}")
+
+    def add_to_list(self, user_id: int) -> bool:
         """
         Add a user to the Twitter list.
 
@@ -133,54 +362,33 @@ class TwitterService:
         Raises:
             Exception: If API error occurs
         """
-        url = f"{self.BASE_URL}/lists/{self.list_id}/members"
-        payload = {"user_id": user_id}
+        url = self._members_url
+        payload = {"user_id": str(user_id)}  # Twitter expects IDs as strings
 
         try:
-            response = requests.post(url, auth=self.auth, json=payload)
-
-            # Capture rate limit info from response
-            self._extract_rate_limit_info(response)
-
-            if response.status_code == 429:
-                rate_limit_reset = response.headers.get('x-rate-limit-reset', 'unknown')
-                remaining = response.headers.get('x-rate-limit-remaining', 'unknown')
-
-                # Convert reset timestamp to readable time
-                reset_time = None
-                try:
-                    reset_time = datetime.fromtimestamp(int(rate_limit_reset), tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-                    logger.error(f"Rate limit exceeded: add_to_list(user_id={user_id}). Remaining: {remaining}, Reset at: {reset_time} (timestamp: {rate_limit_reset})")
-                except (ValueError, TypeError):
-                    logger.error(f"Rate limit exceeded: add_to_list(user_id={user_id}). Remaining: {remaining}, Reset: {rate_limit_reset}")
-
-                # Raise exception with or without reset time
-                if reset_time:
-                    raise Exception(f"Twitter API rate limit exceeded. Resets at {reset_time}. Please wait and try again.")
-                else:
-                    raise Exception("Twitter API rate limit exceeded. Please try again later.")
+            response = self._request("POST", url, "lists/members:add", f"add_to_list(user_id={user_id})", json=payload)
 
             # User already in list is considered success
             if response.status_code == 403:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 if "errors" in error_data:
                     for error in error_data["errors"]:
                         if "already a member" in error.get("message", "").lower():
-                            logger.warning(f"User {user_id} already in list")
+                            logger.warning("User %s already in list", user_id)
                             return True
 
             if response.status_code != 200:
-                logger.error(f"Twitter API error: {response.status_code} - {response.text}")
+                logger.error("Twitter API error: %s - %s", response.status_code, response.text)
                 raise Exception(f"Error adding to list: {response.status_code}")
 
-            logger.info(f"Successfully added user {user_id} to list {self.list_id}")
+            logger.info("Successfully added user %s to list %s", user_id, self.list_id)
             return True
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {str(e)}")
+            logger.error("Request error: %s", e)
             raise Exception(f"Network error while adding to list: {str(e)}")
 
-    def remove_from_list(self, user_id: str) -> bool:
+    def remove_from_list(self, user_id: int) -> bool:
         """
         Remove a user from the Twitter list.
 
@@ -193,47 +401,72 @@ class TwitterService:
         Raises:
             Exception: If API error occurs
         """
-        url = f"{self.BASE_URL}/lists/{self.list_id}/members/{user_id}"
+        url = f"{self._members_url}/{user_id}"
 
         try:
-            response = requests.delete(url, auth=self.auth)
-
-            # Capture rate limit info from response
-            self._extract_rate_limit_info(response)
-
-            if response.status_code == 429:
-                rate_limit_reset = response.headers.get('x-rate-limit-reset', 'unknown')
-                remaining = response.headers.get('x-rate-limit-remaining', 'unknown')
-
-                # Convert reset timestamp to readable time
-                reset_time = None
-                try:
-                    reset_time = datetime.fromtimestamp(int(rate_limit_reset), tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-                    logger.error(f"Rate limit exceeded: remove_from_list(user_id={user_id}). Remaining: {remaining}, Reset at: {reset_time} (timestamp: {rate_limit_reset})")
-                except (ValueError, TypeError):
-                    logger.error(f"Rate limit exceeded: remove_from_list(user_id={user_id}). Remaining: {remaining}, Reset: {rate_limit_reset}")
-
-                # Raise exception with or without reset time
-                if reset_time:
-                    raise Exception(f"Twitter API rate limit exceeded. Resets at {reset_time}. Please wait and try again.")
-                else:
-                    raise Exception("Twitter API rate limit exceeded. Please try again later.")
+            response = self._request("DELETE", url, "lists/members:remove", f"remove_from_list(user_id={user_id})")
 
             if response.status_code == 404:
-                logger.warning(f"User {user_id} not found in list")
+                logger.warning("User %s not found in list", user_id)
                 return True  # User already not in list
 
             if response.status_code != 200:
-                logger.error(f"Twitter API error: {response.status_code} - {response.text}")
+                logger.error("Twitter API error: %s - %s", response.status_code, response.text)
                 raise Exception(f"Error removing from list: {response.status_code}")
 
-            logger.info(f"Successfully removed user {user_id} from list {self.list_id}")
+            logger.info("Successfully removed user %s from list %s", user_id, self.list_id)
             return True
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {str(e)}")
+            logger.error("Request error: %s", e)
             raise Exception(f"Network error while removing from list: {str(e)}")
 
+    def _call_many(self, func, user_ids: list) -> dict:
+        """
+        Run a single-user list call for many users on a thread pool.
+
+        Membership endpoints take one user per request, so the calls are
+        overlapped instead of made one after another. The shared rate limiter
+        makes calls fail fast once the endpoint's window is used up.
+
+        Args:
+            func: Bound single-user method (add_to_list or remove_from_list)
+            user_ids: Twitter user IDs
+
+        Returns:
+            dict: user_id -> None if the call succeeded, or the exception it raised
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {executor.submit(func, user_id): user_id for user_id in user_ids}
+            for future in as_completed(futures):
+                results[futures[future]] = future.exception()
+        return results
+
+    def add_to_list_many(self, user_ids: list) -> dict:
+        """
+        Add several users to the Twitter list concurrently.
+
+        Args:
+            user_ids: Twitter user IDs
+
+        Returns:
+            dict: user_id -> None if added, or the exception raised for that user
+        """
+        return self._call_many(self.add_to_list, user_ids)
+
+    def remove_from_list_many(self, user_ids: list) -> dict:
+        """
+        Remove several users from the Twitter list concurrently.
+
+        Args:
+            user_ids: Twitter user IDs
+
+        Returns:
+            dict: user_id -> None if removed, or the exception raised for that user
+        """
+        return self._call_many(self.remove_from_list, user_ids)
+
     def get_list_info(self) -> dict:
         """
         Get information about the Twitter list.
@@ -244,95 +477,101 @@ class TwitterService:
         Raises:
             Exception: If API error occurs
         """
-        url = f"{self.BASE_URL}/lists/{self.list_id}"
+        url = self._list_url
 
         try:
-            response = requests.get(url, auth=self.auth)
-
-            # Capture rate limit info from response
-            self._extract_rate_limit_info(response)
+            response = self._request("GET", url, "lists", "get_list_info()")
 
             if response.status_code != 200:
-                logger.error(f"Twitter API error: {response.status_code} - {response.text}")
+                logger.error("Twitter API error: %s - %s", response.status_code, response.text)
                 raise Exception(f"Error fetching list info: {response.status_code}")
 
-            return response.json().get("data", {})
+            return orjson.loads(response.content).get("data", {})
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {str(e)}")
+            logger.error("Request error: %s", e)
             raise Exception(f"Network error while fetching list info: {str(e)}")
 
-    def get_list_members(self) -> list:
+    def iter_list_members(self):
         """
-        Get all members of the Twitter list with pagination support.
+        Iterate over the members of the Twitter list one API page at a time.
 
-        Returns:
-            list: List of member dictionaries with 'id', 'username', and 'name'
+        Pages are yielded as they arrive, so callers can process a large list
+        without holding every member in memory. The next page is requested on a
+        background thread while the caller works on the current one.
+
+        Yields:
+            list: Member dictionaries with 'id', 'username', and 'name' for one page
 
         Raises:
             Exception: If API error occurs
         """
-        url = f"{self.BASE_URL}/lists/{self.list_id}/members"
-        members = []
-        pagination_token = None
+        url = self._members_url
         max_results = 100  # Twitter API max per request
 
+        def fetch_page(page, pagination_token):
+            params = {
+                "max_results": max_results,
+                "user.fields": "id,username,name"
+            }
+
+            if pagination_token:
+                params["pagination_token"] = pagination_token
+
+            return self._request(
+                "GET", url, "lists/members", f"get_list_members(page={page})",
+                params=params
+            )
+
+        page = 1
+        total = 0
+
         try:
-            while True:
-                params = {
-                    "max_results": max_results,
-                    "user.fields": "id,username,name"
-                }
-
-                if pagination_token:
-                    params["pagination_token"] = pagination_token
-
-                response = requests.get(url, auth=self.auth, params=params)
-
-                # Capture rate limit info from response
-                self._extract_rate_limit_info(response)
-
-                if response.status_code == 429:
-                    rate_limit_reset = response.headers.get('x-rate-limit-reset', 'unknown')
-                    remaining = response.headers.get('x-rate-limit-remaining', 'unknown')
-
-                    # Convert reset timestamp to readable time
-                    from datetime import datetime
-                    reset_time = None
-                    try:
-                        reset_time = datetime.fromtimestamp(int(rate_limit_reset), tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-                        logger.error(f"Rate limit exceeded: get_list_members(page={len(members)//max_results + 1}). Remaining: {remaining}, Reset at: {reset_time} (timestamp: {rate_limit_reset})")
-                    except (ValueError, TypeError):
-                        logger.error(f"Rate limit exceeded: get_list_members(page={len(members)//max_results + 1}). Remaining: {remaining}, Reset: {rate_limit_reset}")
-
-                    # Raise exception with or without reset time
-                    if reset_time:
-                        raise Exception(f"Twitter API rate limit exceeded. Resets at {reset_time}. Please wait and try again.")
-                    else:
-                        raise Exception("Twitter API rate limit exceeded. Please try again later.")
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                future = prefetcher.submit(fetch_page, page, None)
 
-                if response.status_code != 200:
-                    logger.error(f"Twitter API error: {response.status_code} - {response.text}")
-                    raise Exception(f"Error fetching list members: {response.status_code}")
+                while future:
+                    response = future.result()
 
-                data = response.json()
+                    if response.status_code != 200:
+                        logger.error("Twitter API error: %s - %s", response.status_code, response.text)
+                        raise Exception(f"Error fetching list members: {response.status_code}")
 
-                # Add members from this page
-                page_members = data.get("data", [])
-                members.extend(page_members)
+                    data = orjson.loads(response.content)
 
-                logger.info(f"Fetched {len(page_members)} members (total: {len(members)})")
+                    page_members = data.get("data", [])
+                    total += len(page_members)
 
-                # Check if there are more pages
-                meta = data.get("meta", {})
-                pagination_token = meta.get("next_token")
+                    logger.info("Fetched %s members (total: %s)", len(page_members), total)
 
-                if not pagination_token:
-                    break  # No more pages
+                    # Start fetching the next page, if any, before handing this one over
+                    meta = data.get("meta", {})
+                    pagination_token = meta.get("next_token")
 
-            logger.info(f"Successfully fetched {len(members)} total members from list {self.list_id}")
-            return members
+                    future = None
+                    if pagination_token:
+                        page += 1
+                        future = prefetcher.submit(fetch_page, page, pagination_token)
+
+                    yield page_members
+
+            logger.info("Successfully fetched %s total members from list %s", total, self.list_id)
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {str(e)}")
+            logger.error("Request error: %s", e)
             raise Exception(f"Network error while fetching list members: {str(e)}")
+
+    def get_list_members(self) -> list:
+        """
+        Get all members of the Twitter list with pagination support.
+
+        Returns:
+            list: List of member dictionaries with 'id', 'username', and 'name'
+
+        Raises:
+            Exception: If API error occurs
+        """
+        members = []
+        for page_members in self.iter_list_members():
+            members.extend(page_members)
+        return members
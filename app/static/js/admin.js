@@ -336,6 +336,43 @@ function syncList() {
     })
     .then(response => response.json())
     .then(data => {
+        if (data.success) {
+            // Sync runs in the background; poll until it finishes
+            pollSyncStatus(data.sync_id);
+        } else {
+            if (loadingModal) {
+                loadingModal.classList.add('hidden');
+            }
+            showToast(data.message, 'error');
+            if (button) {
+                button.disabled = false;
+            }
+        }
+    })
+    .catch(error => {
+        if (loadingModal) {
+            loadingModal.classList.add('hidden');
+        }
+        showToast('Network error: ' + error.message, 'error');
+        if (button) {
+            button.disabled = false;
+        }
+    });
+}
+
+// Poll a background sync until it completes or fails
+function pollSyncStatus(syncId) {
+    const button = document.getElementById('sync-button');
+    const loadingModal = document.getElementById('loading-modal');
+
+    fetch(`/admin/sync/${syncId}`)
+    .then(response => response.json())
+    .then(data => {
+        if (!data.done) {
+            setTimeout(() => pollSyncStatus(syncId), 2000);
+            return;
+        }
+
         if (loadingModal) {
             loadingModal.classList.add('hidden');
         }
@@ -21,9 +21,10 @@ class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     SQLALCHEMY_DATABASE_URI = get_database_uri()
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_POOL_SIZE = 10
-    SQLALCHEMY_MAX_OVERFLOW = 20
+    # Per gunicorn worker: enough for its request threads plus the background sync
     SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 5)),
         'pool_pre_ping': True,
         'pool_recycle': 300,
     }
@@ -35,11 +36,19 @@ class Config:
     TWITTER_ACCESS_TOKEN_SECRET = os.getenv('ACCESS_TOKEN_SECRET')
     TWITTER_LIST_ID = os.getenv('LIST_ID')
 
+    # Concurrent Twitter API calls for bulk list operations
+    TWITTER_CONCURRENCY = int(os.getenv('TWITTER_CONCURRENCY', 8))
+
+    # Longest rate limit reset (seconds) a list sync sleeps through instead of failing
+    TWITTER_MAX_429_WAIT = int(os.getenv('TWITTER_MAX_429_WAIT', 90))
+
     # Pagination
     ITEMS_PER_PAGE = 20
 
     # Sync settings
     SYNC_COOLOFF_MINUTES = int(os.getenv('SYNC_COOLOFF_MINUTES', 5))
+    # A sync still in progress after this long is assumed dead (e.g. its worker was recycled)
+    SYNC_TIMEOUT_MINUTES = int(os.getenv('SYNC_TIMEOUT_MINUTES', 30))
 
 
 class DevelopmentConfig(Config):
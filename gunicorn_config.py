@@ -8,12 +8,13 @@ import multiprocessing
 bind = "0.0.0.0:8080"
 
 # Worker configuration
-# Use 2-4 workers for better performance
-workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+# Requests mostly wait on the Twitter API and Postgres, so use few processes
+# with more threads each; every process also holds its own DB connection pool
+workers = int(os.getenv("GUNICORN_WORKERS", max(2, multiprocessing.cpu_count())))
 
 # Use gthread worker class for better I/O handling
 worker_class = "gthread"
-threads = int(os.getenv("GUNICORN_THREADS", 2))
+threads = int(os.getenv("GUNICORN_THREADS", 8))
 
 # Worker temporary directory
 # Use /tmp for App Platform compatibility
@@ -40,3 +41,28 @@ max_requests_jitter = 50
 
 # Preload app for better memory efficiency
 preload_app = True
+
+
+def _dispose_db_pool(worker, close):
+    """Dispose the SQLAlchemy engine's connection pool for the worker's app."""
+    from app import db
+
+    with worker.app.wsgi().app_context():
+        db.engine.dispose(close=close)
+
+
+def post_fork(server, worker):
+    """
+    Give each worker its own database connections.
+
+    With preload_app the engine is created in the master, so any pooled
+    connection would be shared by every forked worker. Drop the inherited pool
+    (without closing the master's sockets) so each worker connects on its own.
+    """
+    _dispose_db_pool(worker, close=False)
+
+
+def worker_int(worker):
+    """Close the worker's database connections on SIGINT/SIGQUIT shutdown."""
+    worker.log.info("Worker shutting down, closing database connections")
+    _dispose_db_pool(worker, close=True)